@@ -1,382 +1,922 @@
-#!/usr/bin/env python3
-# =============================================================================
-# GitHub Asset Compliance Verification Script
-# GitHub资产合规性验证脚本（支持文件、结构、内容、提交验证）
-# 依赖: requests, python-dotenv (需提前安装：pip install requests python-dotenv)
-# 配置说明：通过修改 VERIFICATION_CONFIG 字典适配不同验证需求
-# =============================================================================
-
-import sys
-import os
-import requests
-import base64
-import re
-from typing import Dict, List, Optional, Tuple, Callable
-from dotenv import load_dotenv
-
-# =============================================================================
-# 1. 配置部分 - 根据实际需求修改以下配置
-# =============================================================================
-
-# 环境配置
-ENV_CONFIG = {
-    "env_file_name": ".mcp_env",  # 环境变量文件名
-    "github_token_var": "MCP_GITHUB_TOKEN",  # GitHub令牌环境变量名
-    "github_org_var": "GITHUB_EVAL_ORG",  # GitHub组织/用户名环境变量名
-}
-
-# GitHub API 配置
-GITHUB_API_CONFIG = {
-    "api_accept_format": "application/vnd.github.v3+json",  # API响应格式
-    "success_status_code": 200,  # API成功状态码
-    "not_found_status_code": 404,  # 资源未找到状态码
-    "default_branch": "main",  # 仓库默认分支
-    "file_encoding": "utf-8",  # 仓库文件编码
-    "commit_search_max_count": 10,  # 提交记录最大查询数量
-    "regex_match_flag": "IGNORECASE",  # 提交消息正则匹配模式
-}
-
-# 验证流程配置
-VERIFICATION_FLOW_CONFIG = {
-    "step_number_format": {
-        "file_existence": "1/5",  # 文件存在性验证步骤序号
-        "environment_check": "1/5",  # 环境检查步骤序号
-        "file_structure": "2/5",  # 文件结构验证步骤序号
-        "content_accuracy": "3/5",  # 内容准确性验证步骤序号
-        "commit_record": "4/5",  # 提交记录验证步骤序号
-    },
-    "separator_length": 50,  # 输出分隔符长度
-    "success_message": "✅ 所有验证步骤通过！",  # 最终成功提示文本
-    "exit_code": {
-        "success": 0,  # 验证成功退出码
-        "failure": 1  # 验证失败退出码
-    },
-}
-
-# 验证配置 - 根据实际需求修改以下内容
-VERIFICATION_CONFIG = {
-    # 目标仓库信息
-    "target_repo": "project-analysis",  # 替换为你的仓库名
-    
-    # 目标文件信息（需验证的文件）
-    "target_file": {
-        "path": "document/analysis-report.md",  # 替换为你的文件路径
-        "branch": "main"  # 替换为目标分支
-    },
-    
-    # 必需结构（文件必须包含的内容，如章节标题、表格头部）
-    "required_structures": [
-        "# 项目分析报告",  # 替换为你的必需标题
-        "## 汇总统计",  # 替换为你的必需章节
-        "| 指标 | 数值 |"  # 替换为你的必需表格头部
-    ],
-    
-    # 内容验证规则（支持 stat_match/regex_match/text_match，可增删）
-    "content_rules": [
-        # 规则1：代码行数统计
-        {
-            "type": "stat_match",
-            "target": "代码行数",
-            "expected": "15800"
-        },
-        # 规则2：提交次数统计
-        {
-            "type": "stat_match",
-            "target": "提交次数",
-            "expected": "324"
-        },
-        # 规则3：团队成员统计
-        {
-            "type": "stat_match",
-            "target": "团队成员",
-            "expected": "8"
-        },
-        # 规则4：正则匹配
-        {
-            "type": "regex_match",
-            "target": "团队成员邮箱",
-            "expected": r"\w+@\w+\.\w+"  # 匹配通用邮箱格式
-        },
-        # 规则5：固定文本匹配
-        {
-            "type": "text_match",
-            "target": "项目状态",
-            "expected": "项目状态：已完成"
-        }
-    ],
-    
-    # 提交记录验证（可选，支持模糊匹配）
-    "commit_verification": {
-        "msg_pattern": "项目报告|document|update",  # 提交消息关键词
-        "max_commits": 10  # 搜索最近N条提交
-    }
-}
-
-# =============================================================================
-# 2. 通用工具函数（无需修改，直接复用）
-# =============================================================================
-
-def load_environment() -> Tuple[Optional[str], Optional[str]]:
-    """加载环境变量：GitHub访问令牌和目标组织/用户名"""
-    load_dotenv(ENV_CONFIG["env_file_name"])
-    github_token = os.environ.get(ENV_CONFIG["github_token_var"])
-    github_org = os.environ.get(ENV_CONFIG["github_org_var"])
-    return github_token, github_org
-
-def build_request_headers(github_token: str) -> Dict[str, str]:
-    """构建GitHub API请求头（含授权信息）"""
-    return {
-        "Authorization": f"Bearer {github_token}",
-        "Accept": GITHUB_API_CONFIG["api_accept_format"]
-    }
-
-def call_github_api(
-    endpoint: str,
-    headers: Dict[str, str],
-    org: str,
-    repo: str
-) -> Tuple[bool, Optional[Dict]]:
-    """调用GitHub API并返回（请求状态，响应数据）"""
-    url = f"https://api.github.com/repos/{org}/{repo}/{endpoint}"
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == GITHUB_API_CONFIG["success_status_code"]:
-            return True, response.json()
-        elif response.status_code == GITHUB_API_CONFIG["not_found_status_code"]:
-            print(f"[API 提示] {endpoint} 资源未找到（{GITHUB_API_CONFIG['not_found_status_code']}）", file=sys.stderr)
-            return False, None
-        else:
-            print(f"[API 错误] {endpoint} 状态码：{response.status_code}", file=sys.stderr)
-            return False, None
-    except Exception as e:
-        print(f"[API 异常] 调用 {endpoint} 失败：{str(e)}", file=sys.stderr)
-        return False, None
-
-def get_repository_file_content(
-    file_path: str,
-    headers: Dict[str, str],
-    org: str,
-    repo: str,
-    branch: str = GITHUB_API_CONFIG["default_branch"]
-) -> Optional[str]:
-    """获取指定分支下的文件内容（Base64解码）"""
-    success, result = call_github_api(
-        f"contents/{file_path}?ref={branch}", headers, org, repo
-    )
-    if not success or not result:
-        return None
-    try:
-        return base64.b64decode(result.get("content", "")).decode(GITHUB_API_CONFIG["file_encoding"])
-    except Exception as e:
-        print(f"[文件解码错误] {file_path}：{str(e)}", file=sys.stderr)
-        return None
-
-def search_commits(
-    headers: Dict[str, str],
-    org: str,
-    repo: str,
-    commit_msg_pattern: str,
-    max_commits: int = GITHUB_API_CONFIG["commit_search_max_count"]
-) -> bool:
-    """搜索包含指定消息模式的提交记录（支持模糊匹配）"""
-    success, commits = call_github_api(
-        f"commits?per_page={max_commits}", headers, org, repo
-    )
-    if not success:
-        return False
-    for commit in commits:
-        if re.search(commit_msg_pattern, commit["commit"]["message"], re.IGNORECASE):
-            return True
-    return False
-
-# =============================================================================
-# 3. 验证逻辑函数
-# =============================================================================
-
-def verify_environment_setup() -> Tuple[bool, Optional[str], Optional[str]]:
-    """验证环境配置是否正确"""
-    print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['environment_check']}] 验证环境配置...")
-    
-    github_token, github_org = load_environment()
-    
-    if not github_token:
-        print(f"[环境错误] 未配置 {ENV_CONFIG['github_token_var']}（需在 {ENV_CONFIG['env_file_name']} 中设置）", file=sys.stderr)
-        return False, None, None
-    
-    if not github_org:
-        print(f"[环境错误] 未配置 {ENV_CONFIG['github_org_var']}（需在 {ENV_CONFIG['env_file_name']} 中设置）", file=sys.stderr)
-        return False, None, None
-    
-    print(f"[成功] 环境配置正确")
-    return True, github_token, github_org
-
-def verify_file_existence(
-    headers: Dict[str, str],
-    org: str,
-    repo: str,
-    file_path: str,
-    branch: str
-) -> Tuple[bool, Optional[str]]:
-    """验证目标文件是否存在于指定分支"""
-    print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['file_existence']}] 验证文件存在性：{file_path}（分支：{branch}）...")
-    
-    content = get_repository_file_content(file_path, headers, org, repo, branch)
-    if not content:
-        print(f"[错误] 文件 {file_path} 在 {branch} 分支中未找到", file=sys.stderr)
-        return False, None
-    
-    print(f"[成功] 文件 {file_path} 存在")
-    return True, content
-
-def verify_file_structure(content: str, required_structures: List[str]) -> bool:
-    """验证文件是否包含必需的结构（如章节、关键词、表格头部）"""
-    print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['file_structure']}] 验证文件结构：共需包含 {len(required_structures)} 个必需结构...")
-    
-    missing = []
-    for struct in required_structures:
-        if struct not in content:
-            missing.append(struct)
-    
-    if missing:
-        print(f"[错误] 缺失必需结构：{', '.join(missing)}", file=sys.stderr)
-        return False
-    
-    print(f"[成功] 所有必需结构均存在")
-    return True
-
-def verify_content_accuracy(content: str, content_rules: List[Dict]) -> bool:
-    """验证文件内容是否符合预期规则（如统计数据、正则匹配、枚举值）"""
-    if not content_rules:
-        print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['content_accuracy']}] 跳过] 未配置内容验证规则，直接通过")
-        return True
-    
-    print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['content_accuracy']}] 验证内容准确性：共需校验 {len(content_rules)} 条规则...")
-    lines = content.split("\n")
-    
-    for rule in content_rules:
-        rule_type = rule["type"]
-        target = rule["target"]
-        expected = rule["expected"]
-        matched = False
-        
-        # 规则1：统计数据匹配（如"项目总数：100"）
-        if rule_type == "stat_match":
-            for line in lines:
-                if target in line:
-                    # 提取数字（支持整数/小数）
-                    match = re.search(r"(\d+(?:\.\d+)?)", line)
-                    if match and str(match.group(1)) == str(expected):
-                        matched = True
-                        break
-                if matched:
-                    break
-        
-        # 规则2：正则匹配（如邮箱、手机号、枚举值）
-        elif rule_type == "regex_match":
-            if re.search(expected, content):
-                matched = True
-        
-        # 规则3：固定文本匹配（如"状态：已完成"）
-        elif rule_type == "text_match":
-            if expected in content:
-                matched = True
-        
-        if not matched:
-            print(f"[错误] 内容规则校验失败：{target} 预期 {expected}，实际未匹配", file=sys.stderr)
-            return False
-    
-    print(f"[成功] 所有内容规则校验通过")
-    return True
-
-def verify_commit_record(
-    headers: Dict[str, str],
-    org: str,
-    repo: str,
-    commit_msg_pattern: str,
-    max_commits: int
-) -> bool:
-    """验证仓库是否存在符合预期的提交记录"""
-    print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['commit_record']}] 验证提交记录：搜索包含「{commit_msg_pattern}」的最近 {max_commits} 条提交...")
-    
-    found = search_commits(headers, org, repo, commit_msg_pattern, max_commits)
-    if not found:
-        print(f"[错误] 未找到符合要求的提交记录", file=sys.stderr)
-        return False
-    
-    print(f"[成功] 找到符合要求的提交记录")
-    return True
-
-# =============================================================================
-# 4. 主验证流程（入口函数）
-# =============================================================================
-
-def run_verification_process(verification_config: Dict) -> bool:
-    """执行完整验证流程：环境检查 → 文件存在 → 结构验证 → 内容验证 → 提交验证"""
-    # 打印开始信息
-    separator = "=" * VERIFICATION_FLOW_CONFIG["separator_length"]
-    print(separator)
-    print("开始执行GitHub资产合规性验证")
-    print(separator)
-    
-    # 步骤1：环境检查
-    env_ok, github_token, github_org = verify_environment_setup()
-    if not env_ok:
-        return False
-    
-    repo_name = verification_config["target_repo"]
-    headers = build_request_headers(github_token)
-    print(f"[环境就绪] 目标仓库：{github_org}/{repo_name}\n")
-    
-    # 步骤2：验证文件存在性
-    file_path = verification_config["target_file"]["path"]
-    branch = verification_config["target_file"]["branch"]
-    file_exists, file_content = verify_file_existence(headers, github_org, repo_name, file_path, branch)
-    if not file_exists:
-        return False
-    
-    # 步骤3：验证文件结构
-    structure_valid = verify_file_structure(file_content, verification_config["required_structures"])
-    if not structure_valid:
-        return False
-    
-    # 步骤4：验证内容准确性
-    content_valid = verify_content_accuracy(file_content, verification_config["content_rules"])
-    if not content_valid:
-        return False
-    
-    # 步骤5：验证提交记录
-    commit_config = verification_config.get("commit_verification")
-    if commit_config:
-        commit_valid = verify_commit_record(
-            headers, 
-            github_org, 
-            repo_name, 
-            commit_config["msg_pattern"], 
-            commit_config.get("max_commits", GITHUB_API_CONFIG["commit_search_max_count"])
-        )
-        if not commit_valid:
-            return False
-    else:
-        print(f"[{VERIFICATION_FLOW_CONFIG['step_number_format']['commit_record']}] 跳过] 未配置提交验证规则，直接通过")
-    
-    # 所有步骤通过
-    print("\n" + separator)
-    print(VERIFICATION_FLOW_CONFIG["success_message"])
-    print(f"验证对象：{file_path}")
-    print(f"目标仓库：{github_org}/{repo_name}")
-    print(f"验证分支：{branch}")
-    print(f"通过规则数：{len(verification_config['required_structures']) + len(verification_config['content_rules'])}")
-    if commit_config:
-        print(f"匹配提交消息：{commit_config['msg_pattern']}")
-    print(separator)
-    
-    return True
-
-# =============================================================================
-# 5. 主程序入口
-# =============================================================================
-
-if __name__ == "__main__":
-    # 执行验证并返回结果
-    success = run_verification_process(VERIFICATION_CONFIG)
-    sys.exit(VERIFICATION_FLOW_CONFIG["exit_code"]["success"] if success else VERIFICATION_FLOW_CONFIG["exit_code"]["failure"])
+#!/usr/bin/env python3
+# =============================================================================
+# GitHub Asset Compliance Verification Script
+# GitHub资产合规性验证脚本（支持文件、结构、内容、提交验证）
+# 依赖: requests, python-dotenv (需提前安装：pip install requests python-dotenv)
+# 配置说明：通过修改 VERIFICATION_CONFIG 字典适配不同验证需求
+# =============================================================================
+
+import sys
+import os
+import requests
+import asyncio
+import base64
+import functools
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Callable, Union
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter, Retry
+
+# 可选依赖：pyahocorasick（多模式匹配，大量必需结构时单次扫描即可全部命中）
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 可选依赖：httpx（HTTP/2多路复用，单连接并发承载多个API请求）
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# =============================================================================
+# 1. 配置部分 - 根据实际需求修改以下配置
+# =============================================================================
+
+# 环境配置
+ENV_CONFIG = {
+    "env_file_name": ".mcp_env",  # 环境变量文件名
+    "github_token_var": "MCP_GITHUB_TOKEN",  # GitHub令牌环境变量名
+    "github_org_var": "GITHUB_EVAL_ORG",  # GitHub组织/用户名环境变量名
+}
+
+# GitHub API 配置
+GITHUB_API_CONFIG = {
+    "api_accept_format": "application/vnd.github.v3+json",  # API响应格式
+    "success_status_code": 200,  # API成功状态码
+    "not_found_status_code": 404,  # 资源未找到状态码
+    "default_branch": "main",  # 仓库默认分支
+    "file_encoding": "utf-8",  # 仓库文件编码
+    "commit_search_max_count": 10,  # 提交记录最大查询数量
+    "regex_match_flag": "IGNORECASE",  # 提交消息正则匹配模式
+}
+
+# 验证流程配置
+VERIFICATION_FLOW_CONFIG = {
+    "step_number_format": {
+        "file_existence": "1/5",  # 文件存在性验证步骤序号
+        "environment_check": "1/5",  # 环境检查步骤序号
+        "file_structure": "2/5",  # 文件结构验证步骤序号
+        "content_accuracy": "3/5",  # 内容准确性验证步骤序号
+        "commit_record": "4/5",  # 提交记录验证步骤序号
+    },
+    "separator_length": 50,  # 输出分隔符长度
+    "success_message": "✅ 所有验证步骤通过！",  # 最终成功提示文本
+    "exit_code": {
+        "success": 0,  # 验证成功退出码
+        "failure": 1  # 验证失败退出码
+    },
+}
+
+# 验证配置 - 根据实际需求修改以下内容
+VERIFICATION_CONFIG = {
+    # 目标仓库信息
+    "target_repo": "project-analysis",  # 替换为你的仓库名
+    
+    # 目标文件信息（需验证的文件）
+    "target_file": {
+        "path": "document/analysis-report.md",  # 替换为你的文件路径
+        "branch": "main"  # 替换为目标分支
+    },
+    
+    # 必需结构（文件必须包含的内容，如章节标题、表格头部）
+    "required_structures": [
+        "# 项目分析报告",  # 替换为你的必需标题
+        "## 汇总统计",  # 替换为你的必需章节
+        "| 指标 | 数值 |"  # 替换为你的必需表格头部
+    ],
+    
+    # 内容验证规则（支持 stat_match/regex_match/text_match，可增删）
+    "content_rules": [
+        # 规则1：代码行数统计
+        {
+            "type": "stat_match",
+            "target": "代码行数",
+            "expected": "15800"
+        },
+        # 规则2：提交次数统计
+        {
+            "type": "stat_match",
+            "target": "提交次数",
+            "expected": "324"
+        },
+        # 规则3：团队成员统计
+        {
+            "type": "stat_match",
+            "target": "团队成员",
+            "expected": "8"
+        },
+        # 规则4：正则匹配
+        {
+            "type": "regex_match",
+            "target": "团队成员邮箱",
+            "expected": r"\w+@\w+\.\w+"  # 匹配通用邮箱格式
+        },
+        # 规则5：固定文本匹配
+        {
+            "type": "text_match",
+            "target": "项目状态",
+            "expected": "项目状态：已完成"
+        }
+    ],
+    
+    # 提交记录验证（可选，支持模糊匹配）
+    "commit_verification": {
+        "msg_pattern": "项目报告|document|update",  # 提交消息关键词
+        "max_commits": 10  # 搜索最近N条提交
+    }
+}
+
+# =============================================================================
+# 2. 通用工具函数（无需修改，直接复用）
+# =============================================================================
+
+# 模块日志器：%-风格延迟格式化，库方式引用且日志级别不匹配时不产生任何格式化开销
+logger = logging.getLogger(__name__)
+
+# 预编译正则（模块级编译一次，避免每行/每条提交重复编译）
+_NUM_RE = re.compile(r"(\d+(?:\.\d+)?)")  # 统计数字提取（支持整数/小数）
+_COMMIT_PATTERN_CACHE: Dict[str, "re.Pattern"] = {}  # 提交消息模式 -> 编译结果
+
+def _compile_stat_pattern(target: str) -> "re.Pattern":
+    """编译统计规则的锚定正则：目标名后接冒号或表格分隔符，再取数字
+
+    锚定到目标名可一次全文检索替代逐行拆分+扫描，且不会误取行内
+    无关数字；分隔符同时支持「：」「:」与Markdown表格的「|」。
+    """
+    return re.compile(rf"{re.escape(target)}\s*[:：|]\s*(\d+(?:\.\d+)?)")
+
+def _precompile_config_patterns(config: Dict) -> None:
+    """导入期预编译：配置为模块级常量，正则的解析/编译成本只在进程启动时支付一次，
+    每次报告校验直接复用编译对象（下划线键为内部缓存，配置时无需填写）"""
+    for rule in config["content_rules"]:
+        if rule["type"] == "regex_match":
+            rule["_compiled"] = re.compile(rule["expected"])
+        elif rule["type"] == "stat_match":
+            rule["_compiled"] = _compile_stat_pattern(rule["target"])
+    commit_config = config.get("commit_verification")
+    if commit_config:
+        commit_config["_msg_re"] = re.compile(commit_config["msg_pattern"], re.IGNORECASE)
+        # 用导入期编译结果预热提交消息模式缓存
+        _COMMIT_PATTERN_CACHE[commit_config["msg_pattern"]] = commit_config["_msg_re"]
+
+_precompile_config_patterns(VERIFICATION_CONFIG)
+
+# 进程级文件内容缓存：(org, repo, path, branch) -> (ETag, 内容)。
+# 批量/重试场景下配合 If-None-Match 条件请求，304命中不计入API限额
+_FILE_CACHE: Dict[Tuple[str, str, str, str], Tuple[str, "LazyContent"]] = {}
+
+class LazyContent:
+    """文件内容的惰性视图：bytes与str互转按需进行并记忆化
+
+    结构/文本类校验只需 `.data`（UTF-8 bytes子串判断），正则/统计类校验
+    才需要 `.text`（字符语义）。只配置前者时，整份内容的UTF-8解码完全省去。
+    """
+
+    def __init__(self, raw: Union[bytes, str]):
+        if isinstance(raw, bytes):
+            self._bytes: Optional[bytes] = raw
+            self._text: Optional[str] = None
+        else:
+            self._bytes = None
+            self._text = raw
+
+    @property
+    def data(self) -> bytes:
+        """UTF-8字节视图（源为str时首次访问才编码）"""
+        if self._bytes is None:
+            self._bytes = self._text.encode(GITHUB_API_CONFIG["file_encoding"])
+        return self._bytes
+
+    @property
+    def text(self) -> str:
+        """字符视图（源为bytes时首次访问才解码）"""
+        if self._text is None:
+            self._text = self._bytes.decode(GITHUB_API_CONFIG["file_encoding"])
+        return self._text
+
+    def __bool__(self) -> bool:
+        return bool(self._bytes) if self._bytes is not None else bool(self._text)
+
+def load_environment() -> Tuple[Optional[str], Optional[str]]:
+    """加载环境变量：GitHub访问令牌和目标组织/用户名"""
+    load_dotenv(ENV_CONFIG["env_file_name"])
+    github_token = os.environ.get(ENV_CONFIG["github_token_var"])
+    github_org = os.environ.get(ENV_CONFIG["github_org_var"])
+    return github_token, github_org
+
+# Accept头为导入期常量，模块加载时固化为模板，避免每次请求重建
+_HEADER_TEMPLATE = {"Accept": GITHUB_API_CONFIG["api_accept_format"]}
+
+@functools.lru_cache(maxsize=4)
+def build_request_headers(github_token: str) -> Dict[str, str]:
+    """构建GitHub API请求头（含授权信息；同一令牌的结果缓存复用，调用方不得原地修改）"""
+    return {"Authorization": f"Bearer {github_token}", **_HEADER_TEMPLATE}
+
+def create_api_session() -> requests.Session:
+    """创建复用TCP/TLS连接的会话（连接池+指数退避重试，避免每次请求重新握手）"""
+    session = requests.Session()
+    # 瞬时5xx/429自动重试（尊重Retry-After头），配合显式超时约束最坏时延
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504, 429],
+        respect_retry_after_header=True,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+    return session
+
+# 模块级默认会话：未显式传入会话的调用共享同一连接池与重试策略
+SESSION = create_api_session()
+
+# 连接超时10秒/读取超时30秒：挂起的TCP连接不再无限期阻塞整个验证流程
+REQUEST_TIMEOUT = (10, 30)
+
+class GitHubClient:
+    """GitHub API客户端：集中持有会话、ETag与进程内响应缓存
+
+    同一进程内对相同端点的重复GET先发条件请求（If-None-Match），
+    304时直接复用缓存的响应——批量校验多文件/多仓库时消除重复
+    API调用的传输与限额成本。
+    """
+
+    def __init__(self, github_token: str, session: Optional[requests.Session] = None):
+        self.headers = build_request_headers(github_token)
+        self.session = session or SESSION
+        self.etags: Dict[Tuple[str, str, str], str] = {}
+        self.cache: Dict[Tuple[str, str, str], Dict] = {}
+
+    def get(self, endpoint: str, org: str, repo: str) -> Tuple[bool, Optional[Dict]]:
+        """GET /repos/{org}/{repo}/{endpoint}，返回（请求状态，响应数据）"""
+        key = (org, repo, endpoint)
+        request_headers = self.headers
+        if key in self.cache:
+            request_headers = dict(self.headers)
+            request_headers["If-None-Match"] = self.etags[key]
+        url = f"https://api.github.com/repos/{org}/{repo}/{endpoint}"
+        try:
+            response = self.session.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
+            if key in self.cache and response.status_code == 304:
+                return True, self.cache[key]
+            if response.status_code == GITHUB_API_CONFIG["success_status_code"]:
+                data = response.json()
+                etag = response.headers.get("ETag")
+                if etag:
+                    self.cache[key] = data
+                    self.etags[key] = etag
+                return True, data
+            elif response.status_code == GITHUB_API_CONFIG["not_found_status_code"]:
+                logger.warning("[API 提示] %s 资源未找到（%s）", endpoint, GITHUB_API_CONFIG["not_found_status_code"])
+                return False, None
+            else:
+                logger.error("[API 错误] %s 状态码：%s", endpoint, response.status_code)
+                return False, None
+        except Exception as e:
+            logger.error("[API 异常] 调用 %s 失败：%s", endpoint, e)
+            return False, None
+
+def get_repository_file_content(
+    file_path: str,
+    client: GitHubClient,
+    org: str,
+    repo: str,
+    branch: str = GITHUB_API_CONFIG["default_branch"]
+) -> Optional[LazyContent]:
+    """获取指定分支下的文件内容（优先raw媒体类型直取正文，失败时回退Base64解码）
+
+    返回 LazyContent：原始bytes直接持有，UTF-8解码推迟到真正需要字符语义时。
+    """
+    # raw媒体类型让GitHub直接返回文件正文：省去Base64解码与JSON解析，
+    # 传输字节数也比Base64编码少约25%
+    url = f"https://api.github.com/repos/{org}/{repo}/contents/{file_path}?ref={branch}"
+    cache_key = (org, repo, file_path, branch)
+    cached = _FILE_CACHE.get(cache_key)
+    raw_headers = dict(client.headers)
+    raw_headers["Accept"] = "application/vnd.github.raw"
+    if cached:
+        # 条件请求：文件未变化时GitHub返回304（无响应体且不计入限额）
+        raw_headers["If-None-Match"] = cached[0]
+    try:
+        response = client.session.get(url, headers=raw_headers, timeout=REQUEST_TIMEOUT)
+        if cached and response.status_code == 304:
+            return cached[1]
+        if response.status_code == GITHUB_API_CONFIG["success_status_code"]:
+            content = LazyContent(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                _FILE_CACHE[cache_key] = (etag, content)
+            return content
+        if response.status_code == GITHUB_API_CONFIG["not_found_status_code"]:
+            logger.warning("[API 提示] contents/%s 资源未找到（%s）", file_path, GITHUB_API_CONFIG["not_found_status_code"])
+            return None
+    except Exception as e:
+        logger.error("[API 异常] 获取 %s 失败：%s", file_path, e)
+        return None
+    # 非200且非404：部分代理/旧接口不支持raw媒体类型，回退JSON+Base64方案
+    success, result = client.get(f"contents/{file_path}?ref={branch}", org, repo)
+    if not success or not result:
+        return None
+    try:
+        return LazyContent(base64.b64decode(result.get("content", "")))
+    except Exception as e:
+        logger.error("[文件解码错误] %s：%s", file_path, e)
+        return None
+
+# 跨进程ETag缓存文件：定时任务反复校验未变化仓库时，304响应既无响应体也不计限额
+_ETAG_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "execute_verify", "etags.json"
+)
+
+def _load_etag_cache() -> Dict:
+    """读取跨进程ETag缓存（文件缺失或损坏时返回空缓存）"""
+    try:
+        with open(_ETAG_CACHE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _save_etag_cache(cache: Dict) -> None:
+    """写回跨进程ETag缓存（写入失败仅告警，不影响校验结果）"""
+    try:
+        os.makedirs(os.path.dirname(_ETAG_CACHE_FILE), exist_ok=True)
+        with open(_ETAG_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except Exception as e:
+        logger.warning("[缓存提示] 写入ETag缓存失败：%s", e)
+
+def _split_pattern_keywords(commit_msg_pattern: str) -> Optional[List[str]]:
+    """将纯关键词模式（仅含「|」分隔）拆为关键词列表；含其他正则元字符时返回 None"""
+    if re.search(r"[.^$*+?{}\[\]\\()]", commit_msg_pattern):
+        return None
+    keywords = [kw.strip() for kw in commit_msg_pattern.split("|") if kw.strip()]
+    return keywords or None
+
+def search_commits_via_search_api(
+    client: GitHubClient,
+    org: str,
+    repo: str,
+    keywords: List[str],
+    max_commits: int
+) -> Optional[bool]:
+    """通过 GitHub Search API 服务端过滤提交（单次往返，仅返回命中结果）
+
+    命中时返回 True；零命中、接口不可用或请求失败均返回 None（结论不确定），
+    由调用方回退到 REST 提交列表扫描。
+    """
+    query = f"repo:{org}/{repo}+" + "+OR+".join(keywords)
+    url = f"https://api.github.com/search/commits?q={query}&per_page={max_commits}"
+    search_headers = dict(client.headers)
+    search_headers["Accept"] = "application/vnd.github.cloak-preview+json"
+    try:
+        response = client.session.get(url, headers=search_headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == GITHUB_API_CONFIG["success_status_code"]:
+            if response.json().get("total_count", 0) > 0:
+                return True
+            # 搜索接口按分词匹配，弱于大小写不敏感的子串正则（跨词边界、
+            # CJK关键词分词均不可靠）：零命中视为结论不确定，仅正向命中可信，
+            # 交由调用方回退到 REST 列表方案复核
+            return None
+        # 422 等状态说明查询不被支持，交由调用方回退到 REST 列表方案
+        logger.warning("[API 提示] 提交搜索接口状态码：%s，回退到提交列表扫描", response.status_code)
+        return None
+    except Exception as e:
+        logger.warning("[API 异常] 提交搜索失败：%s，回退到提交列表扫描", e)
+        return None
+
+def search_commits(
+    client: GitHubClient,
+    org: str,
+    repo: str,
+    commit_msg_pattern: str,
+    max_commits: int = GITHUB_API_CONFIG["commit_search_max_count"]
+) -> bool:
+    """搜索包含指定消息模式的提交记录（支持模糊匹配）"""
+    # 纯关键词模式优先走 Search API（服务端过滤，省流量省解析）；
+    # 含正则元字符或搜索接口不可用时回退到 REST 提交列表 + 客户端正则
+    keywords = _split_pattern_keywords(commit_msg_pattern)
+    if keywords:
+        found = search_commits_via_search_api(client, org, repo, keywords, max_commits)
+        if found is not None:
+            return found
+    # 条件请求：带上次响应的ETag轮询，仓库未变化时GitHub返回304
+    # （无响应体且不计限额），直接复用缓存的提交消息
+    etag_cache = _load_etag_cache()
+    cache_key = f"{org}/{repo}/commits/{max_commits}"
+    cached = etag_cache.get(cache_key)
+    request_headers = dict(client.headers)
+    if cached and cached.get("etag"):
+        request_headers["If-None-Match"] = cached["etag"]
+    url = f"https://api.github.com/repos/{org}/{repo}/commits?per_page={max_commits}"
+    try:
+        response = client.session.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
+    except Exception as e:
+        logger.error("[API 异常] 调用 commits 失败：%s", e)
+        return False
+    if cached and response.status_code == 304:
+        messages = cached.get("messages", [])
+    elif response.status_code == GITHUB_API_CONFIG["success_status_code"]:
+        messages = [commit["commit"]["message"] for commit in response.json()]
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_cache[cache_key] = {"etag": etag, "messages": messages}
+            _save_etag_cache(etag_cache)
+    else:
+        logger.error("[API 错误] commits 状态码：%s", response.status_code)
+        return False
+    return match_commit_messages(messages, commit_msg_pattern)
+
+def match_commit_messages(messages: List[str], commit_msg_pattern: str) -> bool:
+    """判断提交消息列表中是否存在匹配指定模式的消息（模式编译结果跨调用缓存）"""
+    pattern = _COMMIT_PATTERN_CACHE.get(commit_msg_pattern)
+    if pattern is None:
+        pattern = re.compile(commit_msg_pattern, re.IGNORECASE)
+        _COMMIT_PATTERN_CACHE[commit_msg_pattern] = pattern
+    for message in messages:
+        if pattern.search(message):
+            return True
+    return False
+
+# GraphQL查询：一次请求同时取回文件内容与最近提交消息（1次往返、1个限额点）
+_GRAPHQL_VERIFICATION_QUERY = """
+query($o: String!, $r: String!, $e: String!, $n: Int!) {
+  repository(owner: $o, name: $r) {
+    object(expression: $e) { ... on Blob { text isBinary } }
+    defaultBranchRef { target { ... on Commit { history(first: $n) { nodes { message } } } } }
+  }
+}
+"""
+
+def fetch_verification_data_graphql(
+    client: GitHubClient,
+    org: str,
+    repo: str,
+    file_path: str,
+    branch: str,
+    max_commits: int
+) -> Optional[Tuple[Optional[str], List[str]]]:
+    """通过GraphQL单次请求获取（文件内容，最近提交消息列表）；接口不可用时返回 None"""
+    payload = {
+        "query": _GRAPHQL_VERIFICATION_QUERY,
+        "variables": {"o": org, "r": repo, "e": f"{branch}:{file_path}", "n": max_commits},
+    }
+    try:
+        response = client.session.post(
+            "https://api.github.com/graphql", json=payload, headers=client.headers, timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code != GITHUB_API_CONFIG["success_status_code"]:
+            logger.warning("[API 提示] GraphQL接口状态码：%s，回退到REST方案", response.status_code)
+            return None
+        data = response.json()
+        repository = (data.get("data") or {}).get("repository")
+        if not repository:
+            logger.warning("[API 提示] GraphQL响应缺少仓库数据，回退到REST方案")
+            return None
+        blob = repository.get("object") or {}
+        content = blob.get("text") if not blob.get("isBinary") else None
+        branch_ref = repository.get("defaultBranchRef") or {}
+        history = ((branch_ref.get("target") or {}).get("history") or {}).get("nodes") or []
+        messages = [node["message"] for node in history]
+        return content, messages
+    except Exception as e:
+        logger.warning("[API 异常] GraphQL调用失败：%s，回退到REST方案", e)
+        return None
+
+async def fetch_verification_data_async(
+    headers: Dict[str, str],
+    org: str,
+    repo: str,
+    file_path: str,
+    branch: str,
+    max_commits: int,
+    fetch_commits: bool = True
+) -> Optional[Tuple[Optional[LazyContent], List[str]]]:
+    """通过HTTP/2在单条连接上并发获取（文件内容，最近提交消息列表）
+
+    与同步路径共用两级ETag缓存（文件：进程内 _FILE_CACHE；提交：跨进程
+    etags.json），304命中直接复用缓存且不计限额；未配置提交验证时
+    （fetch_commits=False）完全不发起提交请求。
+
+    仅 200/304/404 视为定论；其余状态码（如瞬时5xx）返回 None，
+    交由调用方回退到带重试与Base64兜底的同步路径，而非就地判死。
+    """
+    # 文件条件请求头：复用进程内缓存的ETag
+    file_key = (org, repo, file_path, branch)
+    file_cached = _FILE_CACHE.get(file_key)
+    file_headers = {"Accept": "application/vnd.github.raw"}
+    if file_cached:
+        file_headers["If-None-Match"] = file_cached[0]
+    # 提交条件请求头：复用跨进程ETag缓存
+    commits_response = None
+    if fetch_commits:
+        etag_cache = _load_etag_cache()
+        commits_key = f"{org}/{repo}/commits/{max_commits}"
+        commits_cached = etag_cache.get(commits_key)
+        commits_headers = {}
+        if commits_cached and commits_cached.get("etag"):
+            commits_headers["If-None-Match"] = commits_cached["etag"]
+
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=headers,
+        base_url=f"https://api.github.com/repos/{org}/{repo}/",
+        # 与同步路径一致的连接/读取超时拆分
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[0], read=REQUEST_TIMEOUT[1]),
+    ) as client:
+        file_request = client.get(
+            f"contents/{file_path}",
+            params={"ref": branch},
+            headers=file_headers,
+        )
+        if fetch_commits:
+            file_response, commits_response = await asyncio.gather(
+                file_request,
+                client.get(f"commits?per_page={max_commits}", headers=commits_headers),
+            )
+        else:
+            file_response = await file_request
+
+    content = None
+    if file_cached and file_response.status_code == 304:
+        content = file_cached[1]
+    elif file_response.status_code == GITHUB_API_CONFIG["success_status_code"]:
+        content = LazyContent(file_response.content)
+        etag = file_response.headers.get("ETag")
+        if etag:
+            _FILE_CACHE[file_key] = (etag, content)
+    elif file_response.status_code == GITHUB_API_CONFIG["not_found_status_code"]:
+        logger.warning("[API 提示] contents/%s 资源未找到（%s）", file_path, GITHUB_API_CONFIG["not_found_status_code"])
+    else:
+        logger.warning("[API 提示] contents/%s 状态码：%s，回退到线程池方案", file_path, file_response.status_code)
+        return None
+
+    messages = []
+    if commits_response is not None:
+        if commits_cached and commits_response.status_code == 304:
+            messages = commits_cached.get("messages", [])
+        elif commits_response.status_code == GITHUB_API_CONFIG["success_status_code"]:
+            messages = [commit["commit"]["message"] for commit in commits_response.json()]
+            etag = commits_response.headers.get("ETag")
+            if etag:
+                etag_cache[commits_key] = {"etag": etag, "messages": messages}
+                _save_etag_cache(etag_cache)
+        elif commits_response.status_code == GITHUB_API_CONFIG["not_found_status_code"]:
+            logger.warning("[API 提示] commits 资源未找到（%s）", GITHUB_API_CONFIG["not_found_status_code"])
+        else:
+            logger.warning("[API 提示] commits 状态码：%s，回退到线程池方案", commits_response.status_code)
+            return None
+    return content, messages
+
+# =============================================================================
+# 3. 验证逻辑函数
+# =============================================================================
+
+def verify_environment_setup() -> Tuple[bool, Optional[str], Optional[str]]:
+    """验证环境配置是否正确"""
+    logger.info("[%s] 验证环境配置...", VERIFICATION_FLOW_CONFIG["step_number_format"]["environment_check"])
+    
+    github_token, github_org = load_environment()
+    
+    if not github_token:
+        logger.error("[环境错误] 未配置 %s（需在 %s 中设置）", ENV_CONFIG["github_token_var"], ENV_CONFIG["env_file_name"])
+        return False, None, None
+    
+    if not github_org:
+        logger.error("[环境错误] 未配置 %s（需在 %s 中设置）", ENV_CONFIG["github_org_var"], ENV_CONFIG["env_file_name"])
+        return False, None, None
+    
+    logger.info("[成功] 环境配置正确")
+    return True, github_token, github_org
+
+def verify_file_existence(
+    file_path: str,
+    branch: str,
+    content: Optional[Union[str, LazyContent]]
+) -> Tuple[bool, Optional[Union[str, LazyContent]]]:
+    """验证目标文件是否存在于指定分支（content 为预先并发获取的文件内容）"""
+    logger.info("[%s] 验证文件存在性：%s（分支：%s）...", VERIFICATION_FLOW_CONFIG["step_number_format"]["file_existence"], file_path, branch)
+
+    if not content:
+        logger.error("[错误] 文件 %s 在 %s 分支中未找到", file_path, branch)
+        return False, None
+
+    logger.info("[成功] 文件 %s 存在", file_path)
+    return True, content
+
+# 必需结构数量达到该阈值时改用Aho-Corasick单次扫描（低于阈值时自动机构建开销不划算）
+_AHOCORASICK_MIN_STRUCTURES = 8
+
+def verify_file_structure(
+    content: Union[str, bytes, LazyContent],
+    required_structures: List[str],
+    fail_fast: bool = True
+) -> bool:
+    """验证文件是否包含必需的结构（如章节、关键词、表格头部）
+
+    fail_fast=True 时首个缺失结构即返回失败（调用方只需布尔结论时省去剩余扫描）；
+    fail_fast=False 时完整扫描并报告全部缺失结构。
+
+    content 可传 str 或 UTF-8 bytes：逐结构扫描在bytes上进行——CJK文本解码后的
+    str 内部为UCS-4（每码点4字节），按UTF-8 bytes扫描内存带宽约为其四分之一。
+    """
+    logger.info("[%s] 验证文件结构：共需包含 %d 个必需结构...", VERIFICATION_FLOW_CONFIG["step_number_format"]["file_structure"], len(required_structures))
+
+    if isinstance(content, LazyContent):
+        content = content.data  # 子串判断只需字节视图，跳过UTF-8解码
+    if ahocorasick is not None and len(required_structures) >= _AHOCORASICK_MIN_STRUCTURES:
+        if isinstance(content, bytes):
+            content = content.decode(GITHUB_API_CONFIG["file_encoding"])
+        # 多模式匹配：对content只扫描一次即可判定所有必需结构，
+        # 复杂度 O(|content| + Σ|结构|)，而非逐结构独立扫描的 O(S·|content|)
+        automaton = ahocorasick.Automaton()
+        for struct in required_structures:
+            automaton.add_word(struct, struct)
+        automaton.make_automaton()
+        found = {struct for _, struct in automaton.iter(content)}
+        missing = [struct for struct in required_structures if struct not in found]
+    else:
+        content_bytes = content.encode("utf-8") if isinstance(content, str) else content
+        missing = []
+        for struct in required_structures:
+            if struct.encode("utf-8") not in content_bytes:
+                if fail_fast:
+                    # 只需布尔结论时，首个缺失即可判负，跳过剩余结构的全文扫描
+                    logger.error("[错误] 缺失必需结构：%s", struct)
+                    return False
+                missing.append(struct)
+
+    if missing:
+        logger.error("[错误] 缺失必需结构：%s", ", ".join(missing))
+        return False
+    
+    logger.info("[成功] 所有必需结构均存在")
+    return True
+
+def verify_content_accuracy(content: Union[str, LazyContent], content_rules: List[Dict]) -> bool:
+    """验证文件内容是否符合预期规则（如统计数据、正则匹配、枚举值）"""
+    if not content_rules:
+        logger.info("[%s] 跳过] 未配置内容验证规则，直接通过", VERIFICATION_FLOW_CONFIG["step_number_format"]["content_accuracy"])
+        return True
+
+    logger.info("[%s] 验证内容准确性：共需校验 %d 条规则...", VERIFICATION_FLOW_CONFIG["step_number_format"]["content_accuracy"], len(content_rules))
+
+    # 按类型分组规则：三类规则均直接针对全文匹配，无需逐行处理
+    stat_rules = [r for r in content_rules if r["type"] == "stat_match"]
+    regex_rules = [r for r in content_rules if r["type"] == "regex_match"]
+    text_rules = [r for r in content_rules if r["type"] == "text_match"]
+
+    # 文本规则在UTF-8字节视图上判断（合法UTF-8下子串语义等价）；
+    # 仅正则/统计规则需要字符语义，此处才触发整份内容的解码
+    if isinstance(content, LazyContent):
+        text_haystack: Union[str, bytes] = content.data
+        content = content.text if (stat_rules or regex_rules) else None
+    else:
+        text_haystack = content
+
+    failures = []
+
+    # 规则1：统计数据匹配（如"项目总数：100"或表格行"| 项目总数 | 100 |"）
+    # ——锚定正则单次全文检索，免去逐行拆分与Python层的逐行扫描
+    for rule in stat_rules:
+        pattern = rule.get("_compiled") or _compile_stat_pattern(rule["target"])
+        match = pattern.search(content)
+        if not (match and match.group(1) == str(rule["expected"])):
+            failures.append((rule["target"], rule["expected"]))
+
+    # 规则2：正则匹配（如邮箱、手机号、枚举值）——优先复用导入期编译结果
+    for rule in regex_rules:
+        pattern = rule.get("_compiled") or re.compile(rule["expected"])
+        if not pattern.search(content):
+            failures.append((rule["target"], rule["expected"]))
+
+    # 规则3：固定文本匹配（如"状态：已完成"）
+    for rule in text_rules:
+        expected = rule["expected"]
+        if isinstance(text_haystack, bytes):
+            expected = expected.encode("utf-8")
+        if expected not in text_haystack:
+            failures.append((rule["target"], rule["expected"]))
+
+    if failures:
+        for target, expected in failures:
+            logger.error("[错误] 内容规则校验失败：%s 预期 %s，实际未匹配", target, expected)
+        return False
+
+    logger.info("[成功] 所有内容规则校验通过")
+    return True
+
+def verify_report_content_fused(
+    content: Union[str, bytes, LazyContent],
+    required_structures: List[str],
+    content_rules: List[Dict]
+) -> Optional[bool]:
+    """结构验证与内容验证的融合单遍扫描（步骤2+3）
+
+    必需结构、stat_match目标、text_match期望值本质都是子串包含判断：
+    合并进同一个Aho-Corasick自动机后对content只扫描一遍（一次内存遍历
+    代替多次独立全文扫描），stat数值判定复用分步路径的锚定正则。
+    自动机不可用或模式数量不足时返回 None，由调用方走分步校验。
+    """
+    if ahocorasick is None:
+        return None
+    stat_rules = [r for r in content_rules if r["type"] == "stat_match"]
+    text_rules = [r for r in content_rules if r["type"] == "text_match"]
+    regex_rules = [r for r in content_rules if r["type"] == "regex_match"]
+    needles = set(required_structures)
+    needles.update(r["target"] for r in stat_rules)
+    needles.update(r["expected"] for r in text_rules)
+    if len(needles) < _AHOCORASICK_MIN_STRUCTURES:
+        return None
+    if isinstance(content, LazyContent):
+        content = content.text
+    elif isinstance(content, bytes):
+        content = content.decode(GITHUB_API_CONFIG["file_encoding"])
+
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    hits: Dict[str, List[int]] = {}
+    for end_idx, needle in automaton.iter(content):
+        hits.setdefault(needle, []).append(end_idx)
+
+    # 步骤2：文件结构（命中即存在）
+    logger.info("[%s] 验证文件结构：共需包含 %d 个必需结构...", VERIFICATION_FLOW_CONFIG["step_number_format"]["file_structure"], len(required_structures))
+    missing = [struct for struct in required_structures if struct not in hits]
+    if missing:
+        logger.error("[错误] 缺失必需结构：%s", ", ".join(missing))
+        return False
+    logger.info("[成功] 所有必需结构均存在")
+
+    # 步骤3：内容准确性
+    logger.info("[%s] 验证内容准确性：共需校验 %d 条规则...", VERIFICATION_FLOW_CONFIG["step_number_format"]["content_accuracy"], len(content_rules))
+    failures = []
+    for rule in stat_rules:
+        matched = False
+        if rule["target"] in hits:
+            # 自动机命中仅作预筛（目标名不存在时免去正则检索）；
+            # 判定复用与分步路径相同的锚定正则，保证两条路径结论一致
+            pattern = rule.get("_compiled") or _compile_stat_pattern(rule["target"])
+            match = pattern.search(content)
+            matched = match is not None and match.group(1) == str(rule["expected"])
+        if not matched:
+            failures.append((rule["target"], rule["expected"]))
+    for rule in text_rules:
+        if rule["expected"] not in hits:
+            failures.append((rule["target"], rule["expected"]))
+    for rule in regex_rules:
+        pattern = rule.get("_compiled") or re.compile(rule["expected"])
+        if not pattern.search(content):
+            failures.append((rule["target"], rule["expected"]))
+
+    if failures:
+        for target, expected in failures:
+            logger.error("[错误] 内容规则校验失败：%s 预期 %s，实际未匹配", target, expected)
+        return False
+    logger.info("[成功] 所有内容规则校验通过")
+    return True
+
+def verify_commit_record(
+    commit_msg_pattern: str,
+    max_commits: int,
+    found: bool
+) -> bool:
+    """验证仓库是否存在符合预期的提交记录（found 为预先并发搜索的结果）"""
+    logger.info("[%s] 验证提交记录：搜索包含「%s」的最近 %d 条提交...", VERIFICATION_FLOW_CONFIG["step_number_format"]["commit_record"], commit_msg_pattern, max_commits)
+
+    if not found:
+        logger.error("[错误] 未找到符合要求的提交记录")
+        return False
+    
+    logger.info("[成功] 找到符合要求的提交记录")
+    return True
+
+# =============================================================================
+# 4. 主验证流程（入口函数）
+# =============================================================================
+
+def run_verification_process(verification_config: Dict) -> bool:
+    """执行完整验证流程：环境检查 → 文件存在 → 结构验证 → 内容验证 → 提交验证"""
+    # 打印开始信息
+    # 横幅一次性写出：单次stdout加锁/刷新，避免逐行print的重复开销
+    separator = "=" * VERIFICATION_FLOW_CONFIG["separator_length"]
+    sys.stdout.write("\n".join([separator, "开始执行GitHub资产合规性验证", separator]) + "\n")
+    
+    # 步骤1：环境检查
+    env_ok, github_token, github_org = verify_environment_setup()
+    if not env_ok:
+        return False
+    
+    repo_name = verification_config["target_repo"]
+    client = GitHubClient(github_token)
+    logger.info("[环境就绪] 目标仓库：%s/%s\n", github_org, repo_name)
+
+    file_path = verification_config["target_file"]["path"]
+    branch = verification_config["target_file"]["branch"]
+    commit_config = verification_config.get("commit_verification")
+
+    commit_found = None
+    max_commits = GITHUB_API_CONFIG["commit_search_max_count"]
+    if commit_config:
+        max_commits = commit_config.get("max_commits", max_commits)
+
+    # 优先GraphQL：一次往返同时取回文件内容与最近提交消息（1个限额点）
+    graphql_data = fetch_verification_data_graphql(
+        client, github_org, repo_name, file_path, branch, max_commits
+    )
+    if graphql_data is not None:
+        file_content, commit_messages = graphql_data
+        if commit_config:
+            commit_found = match_commit_messages(commit_messages, commit_config["msg_pattern"])
+    else:
+        # 回退REST：文件获取与提交搜索互不依赖。装有httpx时走HTTP/2，
+        # 两个请求在同一条连接上多路复用（1次TLS握手）
+        async_result = None
+        if httpx is not None:
+            try:
+                async_result = asyncio.run(fetch_verification_data_async(
+                    client.headers, github_org, repo_name, file_path, branch, max_commits,
+                    fetch_commits=commit_config is not None
+                ))
+            except Exception as e:
+                logger.warning("[API 异常] HTTP/2异步获取失败：%s，回退到线程池方案", e)
+        if async_result is not None:
+            file_content, commit_messages = async_result
+            if commit_config:
+                commit_found = match_commit_messages(commit_messages, commit_config["msg_pattern"])
+        else:
+            # 同步路径：复用同一会话（连接池）并发执行，整体耗时取两者较大值而非两者之和
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                file_future = pool.submit(
+                    get_repository_file_content, file_path, client, github_org, repo_name, branch
+                )
+                if commit_config:
+                    commit_future = pool.submit(
+                        search_commits, client, github_org, repo_name,
+                        commit_config["msg_pattern"], max_commits
+                    )
+                    commit_found = commit_future.result()
+                file_content = file_future.result()
+
+    # 步骤2：验证文件存在性
+    file_exists, file_content = verify_file_existence(file_path, branch, file_content)
+    if not file_exists:
+        return False
+
+    # 步骤3+4：结构与内容验证（模式足够多时融合为单遍扫描，否则分步执行）
+    fused_result = verify_report_content_fused(
+        file_content,
+        verification_config["required_structures"],
+        verification_config["content_rules"]
+    )
+    if fused_result is not None:
+        if not fused_result:
+            return False
+    else:
+        structure_valid = verify_file_structure(file_content, verification_config["required_structures"])
+        if not structure_valid:
+            return False
+
+        content_valid = verify_content_accuracy(file_content, verification_config["content_rules"])
+        if not content_valid:
+            return False
+    
+    # 步骤5：验证提交记录（搜索已在步骤2前并发完成，此处只消费结果）
+    if commit_config:
+        commit_valid = verify_commit_record(
+            commit_config["msg_pattern"], max_commits, commit_found
+        )
+        if not commit_valid:
+            return False
+    else:
+        logger.info("[%s] 跳过] 未配置提交验证规则，直接通过", VERIFICATION_FLOW_CONFIG["step_number_format"]["commit_record"])
+    
+    # 所有步骤通过
+    out = [
+        "",
+        separator,
+        VERIFICATION_FLOW_CONFIG["success_message"],
+        f"验证对象：{file_path}",
+        f"目标仓库：{github_org}/{repo_name}",
+        f"验证分支：{branch}",
+        f"通过规则数：{len(verification_config['required_structures']) + len(verification_config['content_rules'])}",
+    ]
+    if commit_config:
+        out.append(f"匹配提交消息：{commit_config['msg_pattern']}")
+    out.append(separator)
+    sys.stdout.write("\n".join(out) + "\n")
+    
+    return True
+
+# =============================================================================
+# 5. 主程序入口
+# =============================================================================
+
+if __name__ == "__main__":
+    # 仅脚本方式运行时输出过程日志；作为库引用时由调用方决定日志配置
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    # 执行验证并返回结果
+    success = run_verification_process(VERIFICATION_CONFIG)
+    sys.exit(VERIFICATION_FLOW_CONFIG["exit_code"]["success"] if success else VERIFICATION_FLOW_CONFIG["exit_code"]["failure"])